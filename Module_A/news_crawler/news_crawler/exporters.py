@@ -0,0 +1,17 @@
+# Define here your custom feed exporters
+#
+# See documentation in:
+# https://docs.scrapy.org/en/latest/topics/exporters.html
+
+import orjson
+from scrapy.exporters import JsonLinesItemExporter
+
+
+class OrjsonJsonLinesItemExporter(JsonLinesItemExporter):
+    # JSON Lines exporter that serializes items with orjson instead of the
+    # pure-Python ScrapyJSONEncoder. orjson always emits UTF-8 without
+    # escaping non-ASCII text, matching FEED_EXPORT_ENCODING = "utf-8".
+
+    def export_item(self, item):
+        itemdict = dict(self._get_serialized_fields(item))
+        self.file.write(orjson.dumps(itemdict, option=orjson.OPT_APPEND_NEWLINE))
@@ -1,14 +1,165 @@
+import asyncio
 import re
+import sys
+from importlib.util import find_spec
+
+import httpx
+import lxml.html
 import scrapy
+from xxhash import xxh3_64_intdigest
+from lxml import etree
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from scrapy.http import TextResponse
-from urllib.parse import urlparse
+from scrapy.utils.misc import load_object
+from scrapy.utils.url import url_is_from_any_domain
+from urllib.parse import urljoin, urlparse
+
+# Run the asyncio reactor on uvloop where it is available; uvloop does not
+# support Windows, where the default loop is kept.
+_EVENT_LOOP_SETTINGS = (
+    {"ASYNCIO_EVENT_LOOP": "uvloop.Loop"}
+    if sys.platform != "win32" and find_spec("uvloop") is not None
+    else {}
+)
+
+TOPIC_PREFIX = "https://www.dhakapost.com/topic/"
+
+# Main sections (stable)
+SECTIONS = (
+    "https://www.dhakapost.com/latest-news",
+    "https://www.dhakapost.com/popular-bangla-news",
+    "https://www.dhakapost.com/national",
+    "https://www.dhakapost.com/politics",
+    "https://www.dhakapost.com/economy",
+    "https://www.dhakapost.com/international",
+    "https://www.dhakapost.com/country",
+    "https://www.dhakapost.com/sports",
+    "https://www.dhakapost.com/entertainment",
+)
+
+# source_to_category results for the fixed sections, e.g. sports -> ("sports", None)
+_KNOWN_SOURCES = {
+    url: (sys.intern(url.rsplit("/", 1)[-1]), None) for url in SECTIONS
+}
+
+_ARTICLE_PREFIXES = ("https://www.dhakapost.com/", "http://www.dhakapost.com/")
+
+# Article-page XPaths, compiled once and run directly on the lxml root
+# (skips parsel's per-call selector construction).
+TITLE_XPATH = etree.XPath("string((//h1)[1])", smart_strings=False)
+AUTHOR_XPATH = etree.XPath(
+    "//*[contains(@class,'author') or contains(@class,'writer')]/text()",
+    smart_strings=False,
+)
+AUTHOR_FALLBACK_XPATH = etree.XPath(
+    "//p[contains(@class,'author')]/text()", smart_strings=False
+)
+DATE_XPATH = etree.XPath("(//time)[1]/text()", smart_strings=False)
+PARAS_XPATH = etree.XPath("//article//p | //main//p")
+PARA_TEXTS_XPATH = etree.XPath(".//text()", smart_strings=False)
+
+# Paragraph cleaning: NBSP -> space. A paragraph opening with the read-more
+# marker plus a boundary (e.g. "আরও পড়ুন: <a>headline</a>") is dropped
+# whole. Otherwise only a text node holding nothing but a marker is dropped,
+# so words that merely start with a marker and markers inside real sentences
+# are kept.
+_NBSP_TABLE = {0xA0: 0x20}
+_READ_MORE_MARKER = "আরও পড়ুন"
+_BAD_MARKERS = (
+    _READ_MORE_MARKER,
+    "ফলো করুন",
+    "বিজ্ঞাপন",
+    "লোড হচ্ছে",
+)
+_BAD_RE = re.compile("(?:%s)" % "|".join(map(re.escape, _BAD_MARKERS)))
+_READ_MORE_RE = re.compile(re.escape(_READ_MORE_MARKER) + r"(?=\s*[:：….]|\s*$)")
+_MARKER_TRAIL = " .:…"
+
+
+def first_match(xpath, root):
+    """Returns the first result of a compiled XPath, or None."""
+    results = xpath(root)
+    return results[0] if results else None
+
+
+# List-page link harvesting: a MutationObserver buffers hrefs of newly added
+# article cards in window.__newHrefs, and each click round drains the buffer
+# instead of re-serializing every card on the page.
+INSTALL_HREF_OBSERVER_JS = """
+() => {
+    const sel = "a.group[href]";
+    window.__newHrefs = [];
+    const collect = (root) => {
+        if (root.matches && root.matches(sel)) window.__newHrefs.push(root.href);
+        if (root.querySelectorAll)
+            root.querySelectorAll(sel).forEach(a => window.__newHrefs.push(a.href));
+    };
+    new MutationObserver(ms => {
+        for (const m of ms) for (const n of m.addedNodes) collect(n);
+    }).observe(document.body, {childList: true, subtree: true});
+    collect(document);
+}
+"""
+
+DRAIN_HREFS_JS = """
+() => {
+    const h = window.__newHrefs || [];
+    window.__newHrefs = [];
+    return h;
+}
+"""
+
+NEW_HREFS_PENDING_JS = "() => (window.__newHrefs || []).length > 0"
+
+
+def is_article(url: str) -> bool:
+    """
+    Checks the article URL shape without the regex engine:
+    http(s)://www.dhakapost.com/<section>/<digits>, optional trailing slash.
+    Example:
+      https://www.dhakapost.com/jobs-career/425620 -> True
+    """
+    for prefix in _ARTICLE_PREFIXES:
+        if url.startswith(prefix):
+            rest = url[len(prefix):]
+            break
+    else:
+        return False
+
+    if rest.endswith("/"):
+        rest = rest[:-1]
+    section, sep, article_id = rest.partition("/")
+    # isdecimal() accepts exactly what the regex's \d does
+    return bool(section and sep and article_id.isdecimal())
+
 
-ARTICLE_RE = re.compile(r"^https?://www\.dhakapost\.com/[^/]+/\d+/?$")
+def filter_new(hrefs, match, seen):
+    """
+    Returns the hrefs accepted by ``match`` whose xxh3 digest is not yet in
+    ``seen``, in order and without repeats, and adds their digests to ``seen``.
+    """
+    fresh = {}
+    for url in filter(match, hrefs):
+        h = xxh3_64_intdigest(url)
+        if h not in seen and h not in fresh:
+            fresh[h] = url
+    seen.update(fresh)
+    return list(fresh.values())
+
+
+def normalize_source_url(url: str) -> str:
+    """
+    Dedup key for list sources: lowercase host, no trailing slash.
+    Example:
+      https://www.DhakaPost.com/topic/xxxx/ -> https://www.dhakapost.com/topic/xxxx
+    """
+    p = urlparse(url)
+    return f"{p.scheme}://{p.netloc.lower()}{p.path.rstrip('/')}"
 
 
 def source_to_category(source_url: str):
     """
-    Converts list/source URL into a category label.
+    Converts list/source URL into an interned category label.
     Examples:
       https://www.dhakapost.com/sports -> category="sports"
       https://www.dhakapost.com/topic/xxxx -> category="topic", topic_slug="xxxx"
@@ -16,9 +167,16 @@ def source_to_category(source_url: str):
     if not source_url:
         return ("unknown", None)
 
+    known = _KNOWN_SOURCES.get(source_url)
+    if known:
+        return known
+
+    if source_url.startswith(TOPIC_PREFIX):
+        return ("topic", sys.intern(source_url[len(TOPIC_PREFIX):].rstrip("/")))
+
     if "/topic/" in source_url:
         topic_slug = source_url.rstrip("/").split("/topic/")[-1]
-        return ("topic", topic_slug)
+        return ("topic", sys.intern(topic_slug))
 
     path = urlparse(source_url).path.strip("/")  # e.g. "sports"
     if not path:
@@ -26,12 +184,12 @@ def source_to_category(source_url: str):
 
     # take first path segment only
     category = path.split("/")[0]
-    return (category, None)
+    return (sys.intern(category), None)
 
 
 def url_to_section(article_url: str):
     """
-    Extracts article section from article URL.
+    Extracts article section from article URL (interned: many items share it).
     Example:
       https://www.dhakapost.com/jobs-career/425620 -> section="jobs-career"
     """
@@ -39,23 +197,105 @@ def url_to_section(article_url: str):
         path = urlparse(article_url).path.strip("/")
         parts = path.split("/")
         if len(parts) >= 2:
-            return parts[0]
+            return sys.intern(parts[0])
     except Exception:
         pass
     return None
 
 
+def extract_article(root, url):
+    """
+    Builds the corpus item for an article page from its parsed lxml root.
+    Shared by the httpx fast path and the Scrapy fallback (parse_article).
+    """
+    # all text of the first <h1>, including nested inline elements
+    title = TITLE_XPATH(root).strip() or None
+
+    author = first_match(AUTHOR_XPATH, root) or first_match(
+        AUTHOR_FALLBACK_XPATH, root
+    )
+    author = author.strip() if author else None
+
+    date = first_match(DATE_XPATH, root)
+    if date:
+        date = date.strip()
+
+    cleaned = []
+    for p in PARAS_XPATH(root):
+        texts = [
+            s
+            for t in PARA_TEXTS_XPATH(p)
+            if (s := t.strip().translate(_NBSP_TABLE))
+        ]
+        if not texts or _READ_MORE_RE.match(texts[0]):
+            continue
+        cleaned.extend(
+            s for s in texts if not _BAD_RE.fullmatch(s.rstrip(_MARKER_TRAIL))
+        )
+
+    body = " ".join(cleaned)
+    # cleaned entries are stripped and space-joined, so per-paragraph
+    # counts add up to len(body.split()) without re-scanning body.
+    tokens = sum(len(s.split()) for s in cleaned)
+
+    # section from article URL itself (sometimes better)
+    section = url_to_section(url)
+
+    return {
+        "title": title,
+        "body": body,
+        "url": url,
+        "date": date,
+        "language": "bn",
+        "author": author,
+        "tokens": tokens,
+        "section": section,        # extracted from article URL  
+    }
+
+
+class RateLimiter:
+    """
+    Spaces out fetches to one host by at least ``delay`` seconds, however
+    many workers share it (a lock plus the next allowed fetch time).
+    """
+
+    def __init__(self, delay):
+        self.delay = delay
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+
+    async def wait(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._next_at > now:
+                await asyncio.sleep(self._next_at - now)
+                now = self._next_at
+            self._next_at = now + self.delay
+
+    def backoff(self, seconds):
+        """Holds every waiter back for at least ``seconds`` from now."""
+        now = asyncio.get_running_loop().time()
+        self._next_at = max(self._next_at, now + seconds)
+
+
 class DhakaPostAllTopics500Spider(scrapy.Spider):
     name = "dhakapost_alltopics_500"
     allowed_domains = ["dhakapost.com"]
 
     custom_settings = {
         "CLOSESPIDER_ITEMCOUNT": 1500,   # stop after N items scraped
-        "DOWNLOAD_DELAY": 0.3,
+        "DOWNLOAD_DELAY": 0.1,
         "CONCURRENT_REQUESTS": 8,
-        "CONCURRENT_REQUESTS_PER_DOMAIN": 1,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 4,   # polite, but not serialized
+        # scrapy-playwright needs the asyncio reactor
+        "TWISTED_REACTOR": "twisted.internet.asyncioreactor.AsyncioSelectorReactor",
+        **_EVENT_LOOP_SETTINGS,
         "AUTOTHROTTLE_ENABLED": True,
+        "AUTOTHROTTLE_TARGET_CONCURRENCY": 4,
         "FEED_EXPORT_ENCODING": "utf-8",
+        "FEED_EXPORTERS": {
+            "jsonl": "news_crawler.exporters.OrjsonJsonLinesItemExporter",
+        },
         "LOG_LEVEL": "INFO",
         "USER_AGENT": (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -66,12 +306,23 @@ class DhakaPostAllTopics500Spider(scrapy.Spider):
 
     start_urls = ["https://www.dhakapost.com/"]
 
+    # list pages come from page.context.new_page(), which scrapy-playwright's
+    # PLAYWRIGHT_MAX_PAGES_PER_CONTEXT does not track: this is the page limit
+    list_pages = 4   # Playwright pages crawling list sources concurrently
     max_clicks_per_source = 80
+    max_stale_clicks = 5   # stop a source after this many clicks with no new links
     target_unique_links = 2100
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.seen_links = set()
+        # 64-bit xxh3 digests of seen article URLs (collisions are negligible
+        # at a few thousand links). Shared by every concurrent list worker; the
+        # membership test and add run with no await in between, so no lock is
+        # needed on the event loop.
+        self.seen_links: set[int] = set()
+        # Politeness for fetches made outside the Scrapy downloader
+        self.robots = None
+        self.fetch_limiter = None
 
     async def start(self):
         """Scrapy 2.13+ start()"""
@@ -79,115 +330,310 @@ class DhakaPostAllTopics500Spider(scrapy.Spider):
             yield scrapy.Request(
                 url,
                 callback=self.parse_home,
-                meta={"playwright": True, "playwright_include_page": True},
+                meta={
+                    "playwright": True,
+                    "playwright_include_page": True,
+                    "playwright_context": "default",
+                },
                 dont_filter=True,
             )
 
     async def parse_home(self, response):
         page = response.meta["playwright_page"]
-        await page.wait_for_timeout(1200)
-
-        # Main sections (stable)
-        sections = [
-            "https://www.dhakapost.com/latest-news",
-            "https://www.dhakapost.com/popular-bangla-news",
-            "https://www.dhakapost.com/national",
-            "https://www.dhakapost.com/politics",
-            "https://www.dhakapost.com/economy",
-            "https://www.dhakapost.com/international",
-            "https://www.dhakapost.com/country",
-            "https://www.dhakapost.com/sports",
-            "https://www.dhakapost.com/entertainment",
-        ]
+        pages = [page]
+        tasks = []
+        try:
+            await page.wait_for_timeout(1200)
+
+            await self.load_robots(page)
+            delay = self.settings.getfloat("DOWNLOAD_DELAY")
+            self.fetch_limiter = RateLimiter(delay)
+
+            # Grab topic links automatically from homepage
+            topic_urls = await page.eval_on_selector_all(
+                f"a[href^='{TOPIC_PREFIX}']",
+                "els => Array.from(new Set(els.map(e => e.href)))",
+            )
+
+            # Dedup on the normalized URL: "/topic/x" and "/topic/x/" are one source
+            unique_sources = {}
+            for u in [*SECTIONS, *topic_urls]:
+                unique_sources.setdefault(normalize_source_url(u), u)
+            sources = list(unique_sources.values())
+            self.logger.info(
+                "Collected %d sources (sections + topics).", len(sources)
+            )
+
+            # Crawl the list sources on a small pool of long-lived pages in the
+            # homepage's browser context: each worker navigates its page from
+            # one source to the next instead of opening a fresh page per source.
+            pending = asyncio.Queue()
+            for src in sources:
+                pending.put_nowait(src)
+
+            # Article requests found by the list workers are fetched directly
+            # with httpx by the article workers; items (and Scrapy fallback
+            # requests for failed fetches) come back through ``out``.
+            articles = asyncio.Queue()
+            out = asyncio.Queue()
+
+            # Built before any extra page is opened: if h2 is missing this
+            # raises with only the homepage open, and the finally closes it.
+            client = httpx.AsyncClient(
+                http2=True,
+                headers={"User-Agent": self.settings.get("USER_AGENT")},
+                follow_redirects=True,
+                timeout=30,
+            )
+            async with client:
+                for _ in range(min(self.list_pages, len(sources)) - 1):
+                    pages.append(await page.context.new_page())
+
+                list_tasks = [
+                    asyncio.create_task(self.list_worker(p, pending, articles))
+                    for p in pages
+                ]
+                # one article worker per allowed concurrent request to the host
+                n_article_workers = self.settings.getint(
+                    "CONCURRENT_REQUESTS_PER_DOMAIN"
+                )
+                article_tasks = [
+                    asyncio.create_task(self.article_worker(client, articles, out))
+                    for _ in range(n_article_workers)
+                ]
+
+                async def stop_articles_when_listed():
+                    await asyncio.gather(*list_tasks, return_exceptions=True)
+                    for _ in article_tasks:
+                        articles.put_nowait(None)
+
+                tasks = [*list_tasks, *article_tasks]
+                tasks.append(asyncio.create_task(stop_articles_when_listed()))
+
+                running = len(article_tasks)
+                while running:
+                    result = await out.get()
+                    if result is None:   # an article worker finished
+                        running -= 1
+                        continue
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            for p in pages:
+                await p.close()
+
+    async def load_robots(self, page):
+        """
+        Parses robots.txt once for the fetches this spider makes outside the
+        Scrapy downloader (list-page navigation, httpx article fetches).
+        Like RobotsTxtMiddleware, a robots.txt that cannot be fetched allows all.
+        """
+        if not self.settings.getbool("ROBOTSTXT_OBEY"):
+            return
+
+        url = urljoin(self.start_urls[0], "/robots.txt")
+        try:
+            resp = await page.context.request.get(url)
+            body = await resp.body() if resp.ok else b""
+        except Exception as e:
+            self.logger.warning("Could not fetch %s (%s); allowing all", url, e)
+            return
+
+        parser_cls = load_object(self.settings.get("ROBOTSTXT_PARSER"))
+        self.robots = parser_cls.from_crawler(self.crawler, body)
 
-        # Grab topic links automatically from homepage
-        topic_urls = await page.eval_on_selector_all(
-            "a[href^='https://www.dhakapost.com/topic/']",
-            "els => Array.from(new Set(els.map(e => e.href)))",
+    def robots_allowed(self, url):
+        if self.robots is None:
+            return True
+        user_agent = self.settings.get("ROBOTSTXT_USER_AGENT") or self.settings.get(
+            "USER_AGENT"
         )
+        return self.robots.allowed(url, user_agent)
 
-        sources = list(dict.fromkeys(sections + topic_urls))
-        self.logger.info("Collected %d sources (sections + topics).", len(sources))
+    async def list_worker(self, page, pending, articles):
+        """Crawls queued list sources one after another on the same page."""
+        while not pending.empty():
+            if len(self.seen_links) >= self.target_unique_links:
+                break
 
-        await page.close()
+            src = pending.get_nowait()
+            if not self.robots_allowed(src):
+                self.logger.info("Forbidden by robots.txt: %s", src)
+                continue
 
-        for src in sources:
-            category, topic_slug = source_to_category(src)
+            try:
+                await self.fetch_limiter.wait()
+                await page.goto(src)
+                async for batch in self.parse_list(page, src):
+                    for request in batch:
+                        articles.put_nowait(request)
+            except Exception:
+                self.logger.exception("Failed crawling list %s", src)
+
+    async def article_worker(self, client, articles, out):
+        """
+        Fetches queued article requests with httpx and parses them in place.
+        Fetches share the spider's robots.txt check and rate limiter; requests
+        that fail in transport or parsing are handed back to Scrapy.
+        """
+        max_items = self.settings.getint("CLOSESPIDER_ITEMCOUNT")
+        try:
+            while True:
+                request = await articles.get()
+                if request is None:
+                    break
+                # Items from both the httpx path and the Scrapy fallback, as
+                # counted by the CloseSpider extension itself
+                scraped = self.crawler.stats.get_value("item_scraped_count", 0)
+                if max_items and scraped >= max_items:
+                    break
+
+                try:
+                    result = await self.fetch_article(client, request)
+                except Exception:
+                    self.logger.exception("Failed fetching article %s", request.url)
+                    continue
+                if result is not None:
+                    await out.put(result)
+        finally:
+            await out.put(None)
+
+    async def fetch_article(self, client, request):
+        """
+        Returns the item for one article request, the request itself when
+        Scrapy should fetch it instead, or None when it is skipped.
+        """
+        if not self.robots_allowed(request.url):
+            self.logger.info("Forbidden by robots.txt: %s", request.url)
+            return None
+
+        for attempt in range(self.settings.getint("RETRY_TIMES") + 1):
+            await self.fetch_limiter.wait()
+            try:
+                resp = await client.get(request.url)
+            except httpx.TransportError as e:
+                self.logger.warning(
+                    "httpx fetch failed for %s (%s); retrying via Scrapy",
+                    request.url,
+                    e,
+                )
+                return request
 
-            yield scrapy.Request(
-                src,
-                callback=self.parse_list,
-                meta={
-                    "playwright": True,
-                    "playwright_include_page": True,
-                    "source": src,
-                    "category": category,
-                    "topic_slug": topic_slug,
-                },
-                dont_filter=True,
+            if resp.status_code not in (429, 503):
+                break
+
+            # Server asked us to slow down: hold back every worker, then retry
+            retry_after = resp.headers.get("retry-after", "")
+            self.fetch_limiter.backoff(
+                int(retry_after)
+                if retry_after.isdigit()
+                else self.settings.getfloat("AUTOTHROTTLE_START_DELAY")
+            )
+            self.logger.info(
+                "HTTP %d for %s (attempt %d); backing off",
+                resp.status_code,
+                request.url,
+                attempt + 1,
             )
 
-    async def parse_list(self, response):
-        source = response.meta.get("source", response.url)
-        category = response.meta.get("category", "unknown")
-        topic_slug = response.meta.get("topic_slug")
+        # Transient server errors go to Scrapy, so RetryMiddleware's rules apply
+        retry_codes = {int(c) for c in self.settings.getlist("RETRY_HTTP_CODES")}
+        if resp.status_code >= 500 or resp.status_code in retry_codes:
+            self.logger.warning(
+                "HTTP %d for %s; retrying via Scrapy", resp.status_code, resp.url
+            )
+            return request
+
+        if resp.status_code >= 400:
+            self.logger.warning("Ignoring HTTP %d: %s", resp.status_code, resp.url)
+            return None
+
+        # Redirects are followed by httpx: re-apply the offsite and robots.txt
+        # checks Scrapy would have run on the redirect target
+        final_url = str(resp.url)
+        if final_url != request.url:
+            if not url_is_from_any_domain(final_url, self.allowed_domains):
+                self.logger.info(
+                    "Ignoring offsite redirect %s -> %s", request.url, final_url
+                )
+                return None
+            if not self.robots_allowed(final_url):
+                self.logger.info("Forbidden by robots.txt: %s", final_url)
+                return None
+
+        if "html" not in resp.headers.get("content-type", ""):
+            self.logger.warning("Skipping non-text response: %s", resp.url)
+            return None
+
+        # Decode with the Content-Type charset (httpx falls back to UTF-8)
+        # rather than leaving libxml2 to guess, which turns Bengali pages
+        # without a <meta charset> into Latin-1 mojibake.
+        try:
+            parser = lxml.html.HTMLParser(encoding=resp.encoding)
+            root = lxml.html.document_fromstring(resp.content, parser=parser)
+        except (etree.ParserError, LookupError, ValueError):
+            self.logger.warning("Unparsable page %s; retrying via Scrapy", resp.url)
+            return request
+
+        return extract_article(root, final_url)
+
+    async def parse_list(self, page, source):
+        """
+        Clicks through one list source already loaded in ``page``.
+        Yields one list of new article requests per click.
+        """
+        category, _ = source_to_category(source)   # for the per-click log
 
-        page = response.meta["playwright_page"]
         await page.wait_for_timeout(900)
+        await page.evaluate(INSTALL_HREF_OBSERVER_JS)
 
-        last_total = 0
         stale_rounds = 0
 
         for click_i in range(self.max_clicks_per_source):
             if len(self.seen_links) >= self.target_unique_links:
                 break
 
-            hrefs = await page.eval_on_selector_all(
-                "a.group[href]",
-                "els => els.map(e => e.href)",
-            )
-
-            new_count = 0
-            for url in hrefs:
-                if not ARTICLE_RE.match(url):
-                    continue
-                if url in self.seen_links:
-                    continue
-
-                self.seen_links.add(url)
-                new_count += 1
+            hrefs = await page.evaluate(DRAIN_HREFS_JS)
 
-                yield scrapy.Request(
+            new_requests = [
+                scrapy.Request(
                     url,
                     callback=self.parse_article,
                     meta={
+                        "playwright": False,   # articles are static HTML
                         "source_list": source,
-                        "category": category,
-                        "topic_slug": topic_slug,
                     },
                     dont_filter=True,
                 )
+                for url in filter_new(hrefs, is_article, self.seen_links)
+            ]
 
             self.logger.info(
-                "LIST %s click=%d -> links=%d | NEW=%d | unique_total=%d | category=%s",
-                response.url,
+                "LIST %s click=%d -> added_links=%d | NEW=%d | unique_total=%d | category=%s",
+                source,
                 click_i + 1,
                 len(hrefs),
-                new_count,
+                len(new_requests),
                 len(self.seen_links),
                 category,
             )
 
-            # Stop if no new links repeatedly
-            if len(self.seen_links) == last_total:
-                stale_rounds += 1
-            else:
+            # Hand this click's new article requests to the scheduler as one batch
+            if new_requests:
+                yield new_requests
                 stale_rounds = 0
-                last_total = len(self.seen_links)
-
-            if stale_rounds >= 5:
-                self.logger.info("Stopping %s: no new links after 5 clicks.", source)
-                break
+            else:
+                # Cards keep loading but are all already seen (topic lists
+                # overlap heavily with the main sections)
+                stale_rounds += 1
+                if stale_rounds >= self.max_stale_clicks:
+                    self.logger.info(
+                        "Stopping %s: no new links after %d clicks.",
+                        source,
+                        stale_rounds,
+                    )
+                    break
 
             # Click "আরও দেখুন"
             btn = page.get_by_role("button", name="আরও দেখুন")
@@ -199,11 +645,17 @@ class DhakaPostAllTopics500Spider(scrapy.Spider):
 
             try:
                 await btn.first.click(timeout=5000)
-                await page.wait_for_timeout(1300)
             except Exception:
                 break
 
-        await page.close()
+            # Wait only until the observer sees new cards; stop if none load
+            try:
+                await page.wait_for_function(NEW_HREFS_PENDING_JS, timeout=1500)
+            except PlaywrightTimeoutError:
+                self.logger.info(
+                    "Stopping %s: no new links after click %d.", source, click_i + 1
+                )
+                break
 
     def parse_article(self, response):
         # Safety: skip if response is not text/html
@@ -211,43 +663,6 @@ class DhakaPostAllTopics500Spider(scrapy.Spider):
             self.logger.warning("Skipping non-text response: %s", response.url)
             return
 
-        title = response.css("h1::text").get() or response.xpath("//h1/text()").get()
-        title = title.strip() if title else None
-
-        author = (
-            response.xpath(
-                "//*[contains(@class,'author') or contains(@class,'writer')]/text()"
-            ).get()
-            or response.xpath("//p[contains(@class,'author')]/text()").get()
-        )
-        author = author.strip() if author else None
-
-        date = response.css("time::text").get()
-        if date:
-            date = date.strip()
-
-        paras = response.xpath("//article//p//text() | //main//p//text()").getall()
-        cleaned = [t.strip().replace("\xa0", " ") for t in paras if t.strip()]
-
-        bad = {"আরও পড়ুন", "ফলো করুন", "বিজ্ঞাপন", "লোড হচ্ছে ..."}
-        cleaned = [t for t in cleaned if t not in bad]
-
-        body = " ".join(cleaned)
-
-        # category from source_list (sports/politics/etc)
-        category = response.meta.get("category", "unknown")
-        topic_slug = response.meta.get("topic_slug")
-
-        # section from article URL itself (sometimes better)
-        section = url_to_section(response.url)
+        assert response.meta.get("playwright") is not True, response.url
 
-        yield {
-            "title": title,
-            "body": body,
-            "url": response.url,
-            "date": date,
-            "language": "bn",
-            "author": author,
-            "tokens": len(body.split()),
-            "section": section,        # extracted from article URL  
-        }
+        yield extract_article(response.selector.root, response.url)